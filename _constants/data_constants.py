@@ -1,4 +1,6 @@
 from dataclasses import dataclass
+from functools import cached_property
+from typing import ClassVar
 
 
 @dataclass(frozen=True)
@@ -144,10 +146,15 @@ class Country:
         "Zambia",
         "Zimbabwe",
     )
+    COUNTRY_SET: ClassVar[frozenset[str]] = frozenset(COUNTRY)  # O(1) membership tests
 
-    def __repr__(self) -> str:
+    @cached_property
+    def _repr(self) -> str:
         return f"Countries in dataset: {self.COUNTRY}"
 
+    def __repr__(self) -> str:
+        return self._repr  # formatted once per instance
+
 
 @dataclass(frozen=True)
 class Bookie:
@@ -208,10 +215,15 @@ class Bookie:
         "WilliamHill.it",
         "Winline.ru",
     )
+    BOOKIE_SET: ClassVar[frozenset[str]] = frozenset(BOOKIE)  # O(1) membership tests
 
-    def __repr__(self) -> str:
+    @cached_property
+    def _repr(self) -> str:
         return f"Allowed bookmaker: {self.BOOKIE}"
 
+    def __repr__(self) -> str:
+        return self._repr  # formatted once per instance
+
 
 @dataclass(frozen=True)
 class Market:
@@ -225,6 +237,17 @@ class Market:
         "HTFT",  # 1./2. half
         "OU",  # over under
     )
+    MARKET_SET: ClassVar[frozenset[str]] = frozenset(MARKET)  # O(1) membership tests
 
-    def __repr__(self) -> str:
+    @cached_property
+    def _repr(self) -> str:
         return f"Allowed markets: {self.MARKET}"
+
+    def __repr__(self) -> str:
+        return self._repr  # formatted once per instance
+
+
+# module level sets for O(1) validation of user input
+COUNTRY_SET = Country.COUNTRY_SET
+BOOKIE_SET = Bookie.BOOKIE_SET
+MARKET_SET = Market.MARKET_SET
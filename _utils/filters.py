@@ -1,8 +1,246 @@
+import re
 from abc import ABC, abstractmethod
-from typing import List
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from numba import njit, prange
+
+from _constants.data_constants import BOOKIE_SET, MARKET_SET, Bookie, Market
+from _utils.patterns import alternation_pattern
+
+_ALLOWED_OPEN_CLOSED = frozenset(["open", "closed"])
+
+_ALLOWED_STATUS = frozenset(
+    [
+        60,  # Postponed
+        70,  # Canceled
+        80,  # Interrupted
+        100,  # Ended (Ended with normal play time)
+        110,  # AET (overtime)
+        120,  # AP (overtime with penalties)
+    ]
+)
+
+_YEAR_PATTERN = re.compile(r"\d+")
+
+
+@lru_cache(maxsize=128)
+def _odds_filter_patterns(
+    bookmaker: Tuple[str, ...],
+    odds_market: Tuple[str, ...],
+    open_closed: Tuple[str, ...],
+) -> Tuple[Tuple[re.Pattern, ...], Tuple[str, ...]]:
+    """
+    Validates the inputs of the odds filter and compiles the column regex patterns.
+    The result is cached on the input tuples, repeated filter calls skip validation and pattern assembly.
+
+    Parameters
+    ----------
+    bookmaker : Tuple[str, ...]
+        Bookmakers to filter
+    odds_market : Tuple[str, ...]
+        Markets to filter
+    open_closed : Tuple[str, ...]
+        Opening or closing odds to filter
+
+    Raises
+    ------
+    ValueError
+        Raises value error if bookmaker, market or wrong open/closed string is found.
+
+    Returns
+    -------
+    Tuple[Tuple[re.Pattern, ...], Tuple[str, ...]]
+        Compiled regex patterns for bookmaker and market columns (only the used ones) and
+        substrings of the open/closed columns to drop.
+        A column is kept if all patterns match and it contains none of the substrings.
+
+    """
+
+    # sanity check the allowed values, all invalid entries are reported at once
+    invalid = set(bookmaker) - BOOKIE_SET
+    if invalid:
+        raise ValueError(
+            f"Invalid bookmaker: {sorted(invalid, key=str)}. Allowed bookmakers are {Bookie.BOOKIE}."
+        )
+
+    invalid = set(odds_market) - MARKET_SET
+    if invalid:
+        raise ValueError(
+            f"Invalid market: {sorted(invalid, key=str)}. Allowed market are {Market.MARKET}."
+        )
+
+    invalid = set(open_closed) - _ALLOWED_OPEN_CLOSED
+    if invalid:
+        raise ValueError(
+            f"Invalid time: {sorted(invalid, key=str)}. Allowed times are {sorted(_ALLOWED_OPEN_CLOSED)}."
+        )
+    open_closed = sorted(
+        _ALLOWED_OPEN_CLOSED - set(open_closed)
+    )  # get opposite of value to drop the open or closed columns and not filter by them (otherwise we lose the active column)
+
+    # same escaped column patterns as the odds slicer
+    patterns = []
+    if bookmaker:
+        patterns.append(alternation_pattern(frozenset(bookmaker), "", "_"))
+    if odds_market:
+        patterns.append(alternation_pattern(frozenset(odds_market), "_", "_"))
+    # columns are only dropped if they contain all opposite values, i.e., if a single one of open/closed was requested
+    excluded = ("_" + open_closed[0],) if len(open_closed) == 1 else ()
+    return tuple(patterns), excluded
+
+
+@njit(parallel=True, cache=True)
+def _odds_keep_mask(arr: np.ndarray, check_zero: np.ndarray) -> np.ndarray:
+    """
+    Row mask for the odds filter. A row is kept if no value is NaN (and not 0 in the columns flagged by check_zero).
+    The rows are checked in parallel and each row stops at the first missing value.
+
+    Parameters
+    ----------
+    arr : np.ndarray
+        2D float64 array with the sliced odds data
+    check_zero : np.ndarray
+        Boolean flag per column, treats 0 (inactive odds) like a missing value
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the rows to keep
+
+    """
+
+    n_rows, n_cols = arr.shape
+    keep = np.empty(n_rows, dtype=np.bool_)
+    for i in prange(n_rows):
+        ok = True
+        for j in range(n_cols):
+            value = arr[i, j]
+            if value != value or (check_zero[j] and value == 0.0):  # NaN != NaN
+                ok = False
+                break
+        keep[i] = ok
+    return keep
+
+
+@lru_cache(maxsize=32)
+def _odds_filter_columns(
+    columns: Tuple[str, ...],
+    patterns: Tuple[re.Pattern, ...],
+    excluded: Tuple[str, ...],
+) -> Tuple[int, ...]:
+    """
+    Positions of the columns the odds filter checks. The result is cached on the column names,
+    repeated filter calls on the same schema (e.g., after row filtering) skip the scan over the column names.
+
+    Parameters
+    ----------
+    columns : Tuple[str, ...]
+        Column names of the dataframe
+    patterns : Tuple[re.Pattern, ...]
+        Compiled regex patterns that all have to match a column
+    excluded : Tuple[str, ...]
+        Substrings that must not be in a column
+
+    Returns
+    -------
+    Tuple[int, ...]
+        Positions of the selected columns
+
+    """
+
+    return tuple(
+        i
+        for i, c in enumerate(columns)
+        if all(p.search(c) for p in patterns) and not any(e in c for e in excluded)
+    )
+
+
+def _is_arrow_string(col: pd.Series) -> bool:
+    """
+    Checks if the column is a string column backed by pyarrow ("string[pyarrow]" or pd.ArrowDtype).
+
+    Parameters
+    ----------
+    col : pd.Series
+        Column to check
+
+    Returns
+    -------
+    bool
+
+    """
+
+    if isinstance(col.dtype, pd.StringDtype):
+        return col.dtype.storage == "pyarrow"
+    if isinstance(col.dtype, pd.ArrowDtype):
+        return pa.types.is_string(col.dtype.pyarrow_dtype) or pa.types.is_large_string(
+            col.dtype.pyarrow_dtype
+        )
+    return False
+
+
+def _sorted_date_bounds(
+    dates: pd.Series, date_start: pd.Timestamp, date_end: pd.Timestamp
+) -> Tuple[int, int] | None:
+    """
+    Positional bounds of the date range if the dates are sorted, found by binary search.
+
+    Parameters
+    ----------
+    dates : pd.Series
+        Dates of the matches
+    date_start : pd.Timestamp
+        Start date of the range (inclusive)
+    date_end : pd.Timestamp
+        End date of the range (inclusive)
+
+    Returns
+    -------
+    Tuple[int, int] | None
+        Start and end position of the rows in range, None if the dates are not sorted.
+
+    """
+
+    if not dates.is_monotonic_increasing:
+        return None
+    start = dates.searchsorted(date_start, side="left")
+    end = dates.searchsorted(date_end, side="right")
+    return start, end
+
+
+def _isin_mask(col: pd.Series, values: set) -> np.ndarray:
+    """
+    Membership mask of a column. Categorical columns are compared on their integer category codes,
+    pyarrow string columns are checked with pyarrow.compute on the UTF-8 buffers and
+    other columns fall back to the hashed pd.Series.isin.
+
+    Parameters
+    ----------
+    col : pd.Series
+        Column to check
+    values : set
+        Values to look for
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask of the rows with a value in values
+
+    """
+
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        wanted_codes = col.cat.categories.get_indexer(list(values))
+        return np.isin(col.cat.codes.to_numpy(), wanted_codes[wanted_codes >= 0])
+    if _is_arrow_string(col):
+        arr = pa.array(col.array)
+        value_set = pa.array(list(values), type=arr.type)
+        return np.asarray(pc.fill_null(pc.is_in(arr, value_set=value_set), False))
+    return col.isin(values).to_numpy()
 
 
 # strategy interface
@@ -27,6 +265,30 @@ class Filter(ABC):
         """
         pass
 
+    def apply_mask(self, df: pd.DataFrame, **kwargs) -> np.ndarray:
+        """
+        Row mask of the filter strategy without slicing the pd.DataFrame.
+        Masks of several strategies can be combined before the rows are sliced once (see ContextFilter.filter_many).
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Strategy context which calls the filter strategy by concrete strategies.
+
+        Raises
+        ------
+        NotImplementedError
+            Raises if the concrete strategy does not provide a row mask.
+
+        Returns
+        -------
+        Boolean np.ndarray of the rows to keep.
+
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} does not provide a row mask, use apply_filter instead."
+        )
+
 
 # context
 class ContextFilter:
@@ -67,11 +329,46 @@ class ContextFilter:
         df = self._filter_strategy.apply_filter(df, **kwargs)
         return df
 
+    def filter_many(
+        self, df: pd.DataFrame, strategies: List[Tuple[Filter, Dict[str, Any]]]
+    ) -> pd.DataFrame:
+        """
+        Applies several filter strategies at once. The row masks of all strategies are combined
+        and the rows are sliced only once instead of copying the pd.DataFrame for every strategy.
+        e.g.:
+            filter_context.filter_many(
+                df,
+                [
+                    (filters.StatusFilter(), {"status_list": [100]}),
+                    (filters.CountryFilter(), {"countries": ["Brazil", "Chile"]}),
+                ],
+            )
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Dataframe to filter
+        strategies : List[Tuple[Filter, Dict[str, Any]]]
+            Filter strategies with their keyword arguments
+
+        Returns
+        -------
+        df : pd.DataFrame
+            filtered by all strategies
+
+        """
+
+        masks = [strategy.apply_mask(df, **kwargs) for strategy, kwargs in strategies]
+        if not masks:
+            return df
+        return df.iloc[np.flatnonzero(np.logical_and.reduce(masks))]
+
 
 # concrete strategies
 class CountryFilter(Filter):
     """
     Concrete filter strategy class. Filters dataset by country in two columns ['country_sofascore', 'country_oddsportal']
+    Note: Storing both columns as pd.Categorical (e.g., with categories from Country.COUNTRY) speeds up the filtering.
     """
 
     def apply_filter(self, df: pd.DataFrame, countries: List[str]) -> pd.DataFrame:
@@ -89,9 +386,23 @@ class CountryFilter(Filter):
             filtered by countries on list
         """
 
-        return df[
-            df[["country_sofascore", "country_oddsportal"]].isin(countries).any(axis=1)
-        ]
+        return df.iloc[self.apply_mask(df, countries)]
+
+    def apply_mask(self, df: pd.DataFrame, countries: List[str]) -> np.ndarray:
+        """
+        Row mask of the country filter (see apply_filter for the parameters).
+
+        Returns
+        -------
+        mask: np.ndarray
+            rows with a country on list
+        """
+
+        country_set = set(countries)  # hashed lookup instead of scanning the list
+        mask = _isin_mask(df["country_sofascore"], country_set)
+        return np.logical_or(
+            mask, _isin_mask(df["country_oddsportal"], country_set), out=mask
+        )  # OR into the first mask buffer, no (rows, 2) intermediate
 
 
 class DateFilter(Filter):
@@ -123,13 +434,40 @@ class DateFilter(Filter):
             filtered by date range
         """
 
-        return df[df["date_sofascore"].between(date_start, date_end)]
+        bounds = _sorted_date_bounds(df["date_sofascore"], date_start, date_end)
+        if bounds is not None:  # sorted dates, slice the rows without a mask
+            return df.iloc[bounds[0] : bounds[1]]
+        return df.iloc[self.apply_mask(df, date_start, date_end)]
+
+    def apply_mask(
+        self,
+        df: pd.DataFrame,
+        date_start: pd.Timestamp,
+        date_end: pd.Timestamp,
+    ) -> np.ndarray:
+        """
+        Row mask of the date filter (see apply_filter for the parameters).
+
+        Returns
+        -------
+        mask: np.ndarray
+            rows in date range
+        """
+
+        dates = df["date_sofascore"]
+        bounds = _sorted_date_bounds(dates, date_start, date_end)
+        if bounds is not None:
+            mask = np.zeros(len(df), dtype=bool)
+            mask[bounds[0] : bounds[1]] = True
+            return mask
+        return dates.between(date_start, date_end).to_numpy()
 
 
 class SeasonFilter(Filter):
     """
     Concrete filter strategy class. Filters dataset by year from column ['season'].
     This column is unique to sofascore data. If sofadata is missing, the value for season entry is 'None'.
+    A season matches if one of its years equals the year (e.g., 2008 matches '2007/2008' and '2008/2009').
     """
 
     def apply_filter(
@@ -151,7 +489,37 @@ class SeasonFilter(Filter):
             filtered by season
         """
 
-        return df[df["season"].str.contains(str(year), na=False)]
+        return df.iloc[self.apply_mask(df, year)]
+
+    def apply_mask(
+        self,
+        df: pd.DataFrame,
+        year: int,
+    ) -> np.ndarray:
+        """
+        Row mask of the season filter (see apply_filter for the parameters).
+
+        Returns
+        -------
+        mask: np.ndarray
+            rows of the season
+        """
+
+        if _is_arrow_string(df["season"]):  # year as whole number in the UTF-8 buffers
+            matches = pc.match_substring_regex(
+                pa.array(df["season"].array), rf"(^|\D){year}(\D|$)"
+            )
+            return np.asarray(pc.fill_null(matches, False))
+
+        # evaluate the few unique seasons instead of every row, rows are mapped back by their codes
+        codes, seasons = pd.factorize(df["season"])
+        year_str = str(year)
+        hits = np.array(
+            [year_str in _YEAR_PATTERN.findall(str(season)) for season in seasons]
+            + [False],  # code -1 (missing season) picks the last entry
+            dtype=bool,
+        )
+        return hits[codes]
 
 
 class StatusFilter(Filter):
@@ -178,22 +546,32 @@ class StatusFilter(Filter):
             filtered by season
         """
 
-        allowed_values = [
-            60,  # Postponed
-            70,  # Canceled
-            80,  # Interrupted
-            100,  # Ended (Ended with normal play time)
-            110,  # AET (overtime)
-            120,  # AP (overtime with penalties)
-        ]
+        return df.iloc[self.apply_mask(df, status_list)]
+
+    def apply_mask(self, df: pd.DataFrame, status_list: List[int]) -> np.ndarray:
+        """
+        Row mask of the status filter (see apply_filter for the parameters).
+
+        Returns
+        -------
+        mask: np.ndarray
+            rows with a status code on list
+        """
 
         for status in status_list:
-            if status not in allowed_values:
+            if status not in _ALLOWED_STATUS:
                 raise ValueError(
-                    f"Invalid status value: '{status}'. Allowed values are {allowed_values}."
+                    f"Invalid status value: '{status}'. Allowed values are {sorted(_ALLOWED_STATUS)}."
                 )
 
-        return df[df.status_code.isin(status_list)]
+        # lookup table indexed by status code, the mask is a single gather without hashing
+        lut = np.zeros(max(_ALLOWED_STATUS) + 1, dtype=bool)
+        lut[np.fromiter(status_list, dtype=np.intp)] = True
+        codes = df["status_code"].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = (codes >= 0) & (codes < lut.size) & (codes % 1 == 0)  # NaN is invalid
+        mask = np.zeros(len(codes), dtype=bool)
+        mask[valid] = lut[codes[valid].astype(np.intp)]
+        return mask
 
 
 class StatisticsFilter(Filter):
@@ -246,19 +624,46 @@ class StatisticsFilter(Filter):
 
         """
 
-        if formation:
-            df = df[df["home_lineup_formation"].notna()]
-        if player_data:
-            df = df[df["home_num_players"].notna()]
-        if incident:
-            df = df[df["incident_incidentType_0"].notna()]
-        if statistics:
-            df = df[df["stats_all_tvdata_corner_kicks_home"].notna()]
-        if graph:
-            df = df[df["minute_1"].notna()]
-        if vote:
-            df = df[df["vote1"].notna()]
-        return df
+        if not any((formation, player_data, incident, statistics, graph, vote)):
+            return df
+        return df.iloc[
+            self.apply_mask(
+                df, formation, player_data, incident, statistics, graph, vote
+            )
+        ]
+
+    def apply_mask(
+        self,
+        df: pd.DataFrame,
+        formation: bool = False,
+        player_data: bool = False,
+        incident: bool = False,
+        statistics: bool = False,
+        graph: bool = False,
+        vote: bool = False,
+    ) -> np.ndarray:
+        """
+        Row mask of the statistics filter (see apply_filter for the parameters).
+
+        Returns
+        -------
+        mask : np.ndarray
+            rows with the sofascore information
+
+        """
+
+        checks = (
+            (formation, "home_lineup_formation"),
+            (player_data, "home_num_players"),
+            (incident, "incident_incidentType_0"),
+            (statistics, "stats_all_tvdata_corner_kicks_home"),
+            (graph, "minute_1"),
+            (vote, "vote1"),
+        )
+        masks = [df[col].notna().to_numpy() for flag, col in checks if flag]
+        if not masks:
+            return np.ones(len(df), dtype=bool)
+        return np.logical_and.reduce(masks)
 
 
 class OddsFilter(Filter):
@@ -305,6 +710,26 @@ class OddsFilter(Filter):
 
         """
 
+        return df.iloc[self.apply_mask(df, bookmaker, odds_market, open_closed, active)]
+
+    def apply_mask(
+        self,
+        df: pd.DataFrame,
+        bookmaker: List[str] = None,
+        odds_market: List[str] = None,
+        open_closed: List[str] = None,
+        active: bool = False,
+    ) -> np.ndarray:
+        """
+        Row mask of the odds filter (see apply_filter for the parameters).
+
+        Returns
+        -------
+        mask : np.ndarray
+            rows with the available odds data
+
+        """
+
         bookmaker = [] if bookmaker is None else bookmaker
         odds_market = [] if odds_market is None else odds_market
         open_closed = [] if open_closed is None else open_closed
@@ -315,117 +740,32 @@ class OddsFilter(Filter):
         if not isinstance(open_closed, list):
             open_closed = [open_closed]
 
-        allowed_bookmaker = [
-            "iFortuna.cz",
-            "eFortuna.pl",
-            "Tipsport.cz",
-            "STS.pl",
-            "bet-at-home",
-            "Chance.cz",
-            "bwin.es",
-            "bwin",
-            "iFortuna.sk",
-            "William Hill",
-            "BetVictor",
-            "10Bet",
-            "ComeOn",
-            "Betfair Exchange",
-            "Betsafe",
-            "Betsson",
-            "bet365",
-            "Marathonbet",
-            "888sport",
-            "Unibet",
-            "188BET",
-            "NordicBet",
-            "Vulkan Bet",
-            "Winline.ru",
-            "Tipsport.sk",
-            "bet365.it",
-            "1xStavka.ru",
-            "1xBet",
-            "Marsbet",
-            "Planetwin365",
-            "Betfair",
-            "Unibet.it",
-            "Dafabet",
-            "Betway",
-            "Coolbet",
-            "WilliamHill.it",
-            "Interwetten",
-            "Betfred",
-            "bwin.it",
-            "Pinnacle",
-            "Totolotek.pl",
-            "Curebet",
-            "VOBET",
-            "10x10bet",
-            "Lasbet",
-            "GGBET",
-            "GGBET.ru",
-            "Eurobet.it",
-            "N1 Bet",
-            "bwin.fr",
-            "Smarkets",
-            "Sportium.es",
-            "Matchbook",
-            "France Pari",
-            "Betclic.fr",
-        ]
-
-        allowed_odds_markets = [
-            "1x2",
-            "BTTS",
-            "DC",
-            "DNB",
-            "HTFT",
-            "OU",
-            "AH",
-            "CS",
-        ]
-
-        allowed_open_closed = ["open", "closed"]
-
-        # sanity check the allowed values
-        for bm in bookmaker:
-            if bm not in allowed_bookmaker:
-                raise ValueError(
-                    f"Invalid bookmaker: '{bm}'. Allowed bookmakers are {allowed_bookmaker}."
-                )
-
-        for om in odds_market:
-            if om not in allowed_odds_markets:
-                raise ValueError(
-                    f"Invalid market: '{om}'. Allowed market are {allowed_odds_markets}."
-                )
+        patterns, excluded = _odds_filter_patterns(
+            tuple(bookmaker), tuple(odds_market), tuple(open_closed)
+        )
+        if not active:
+            excluded += ("_active",)  # drop active column
 
-        for oc in open_closed:
-            if oc not in allowed_open_closed:
-                raise ValueError(
-                    f"Invalid market: '{oc}'. Allowed market are {allowed_open_closed}."
-                )
-        open_closed = list(
-            set(allowed_open_closed) - set(open_closed)
-        )  # get opposite of value to drop the open or closed columns and not filter by them (otherwise we lose the active column)
-
-        # filter dataset by bookmaker, markets and opening/closing odds availabilty
+        # filter dataset by bookmaker, markets and opening/closing odds availabilty in a single pass over the columns
+        # (plain substring checks for the dropped columns, no negative lookahead regex)
         tmp_df = df
-        if bookmaker:
-            pattern1 = "|".join(list(map(lambda x: x + "_", bookmaker)))
-            tmp_df = tmp_df.filter(regex=pattern1)
-        if odds_market:
-            pattern2 = "|".join(list(map(lambda x: "_" + x + "_", odds_market)))
-            tmp_df = tmp_df.filter(regex=pattern2)
-        if open_closed:
-            pattern3 = "|".join(list(map(lambda x: "^(?!.*_" + x + ")", open_closed)))
-            tmp_df = tmp_df.filter(regex=pattern3)
-
-        # filter dataset by active odds (0 and NaN is dropped)
+        if patterns or excluded:
+            cols = _odds_filter_columns(tuple(df.columns), patterns, excluded)
+            if not cols:  # nothing to check, every row is kept
+                return np.ones(len(df), dtype=bool)
+            tmp_df = df.iloc[:, list(cols)]
+
+        # filter dataset by active odds (0 and NaN is dropped) and all NaN after we checked the NaNs from sliced dataframe
+        if all(map(pd.api.types.is_numeric_dtype, tmp_df.dtypes)):
+            # fused NaN/0 check on the raw odds values without the replaced copy.
+            # numpy bool columns are only checked for NaN, replace(0, np.nan) never matches their False values
+            check_zero = np.array(
+                [active and dtype != np.bool_ for dtype in tmp_df.dtypes], dtype=bool
+            )
+            return _odds_keep_mask(
+                tmp_df.to_numpy(dtype=np.float64, na_value=np.nan), check_zero
+            )
+        # non numeric columns are left in the slice
         if active:
             tmp_df = tmp_df.replace(0, np.nan)  # replace 0 (inactive) with NaN
-        else:
-            tmp_df = tmp_df.filter(regex="^(?!.*_active)")  # drop active column
-
-        return df[
-            tmp_df.notna().all(axis=1)
-        ]  # filter all NaN after we checked the NaNs from sliced dataframe
+        return tmp_df.notna().all(axis=1).to_numpy()
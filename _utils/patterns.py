@@ -0,0 +1,31 @@
+import re
+from functools import lru_cache
+from typing import FrozenSet
+
+
+@lru_cache(maxsize=128)
+def alternation_pattern(
+    values: FrozenSet[str], prefix: str, suffix: str
+) -> re.Pattern:
+    """
+    Compiled alternation of the values with a prefix and suffix around every value, e.g. "_1x2_|_ah_".
+    The values are matched literally (escaped), the filters and slicers build their column patterns with it.
+    Memoized on the set of values, the pattern string is built and compiled once.
+
+    Parameters
+    ----------
+    values : FrozenSet[str]
+        Values of the alternation
+    prefix : str
+        Prefix of every value
+    suffix : str
+        Suffix of every value
+
+    Returns
+    -------
+    re.Pattern
+        Compiled alternation pattern
+
+    """
+
+    return re.compile("|".join(prefix + re.escape(v) + suffix for v in sorted(values)))
@@ -16,16 +16,16 @@ NOTE from documentation:
     
 """
 
-import inspect
+import os
+import sys
+import urllib.request
 from abc import ABC, abstractmethod
-from functools import wraps
-from typing import Callable, List, Tuple
+from functools import lru_cache, wraps
+from operator import methodcaller
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
 
 import matplotlib
-import matplotlib.collections as mcoll
-import matplotlib.legend as mlegend
-import matplotlib.lines as mlines
-import matplotlib.patches as mpatches
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn.objects as so
@@ -33,6 +33,36 @@ from seaborn._core.scales import Scale
 
 # from matplotlib import style
 
+# transforms accepted by "add_mark" (a tuple, isinstance has a fast path for it)
+_ALLOWED_TRANSFORMS = (so.Stat, so.Move, so.Mark)
+_STYLE_URL = "https://raw.githubusercontent.com/Schoepfloeffel/mplstyles/main/schoepfloeffel_style_1.mplstyle"
+_STYLE_APPLIED = False  # the style is applied process-wide by the first PlotBuilder
+
+
+# ---- Style file
+@lru_cache(maxsize=1)
+def _get_style_path() -> str:
+    """
+    Returns the local path of the custom style. The style is downloaded once from _STYLE_URL
+    into the user cache directory ($XDG_CACHE_HOME or ~/.cache) and read from disk afterwards.
+
+    Returns
+    -------
+    str
+        Path of the local style file
+
+    """
+    cache_dir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    style_path = cache_dir / "sportsbetting_medium" / _STYLE_URL.rsplit("/", 1)[-1]
+    if not style_path.is_file():
+        style_path.parent.mkdir(parents=True, exist_ok=True)
+        with urllib.request.urlopen(_STYLE_URL, timeout=10) as response:
+            content = response.read()
+        tmp_path = style_path.with_suffix(".tmp")
+        tmp_path.write_bytes(content)
+        tmp_path.replace(style_path)  # no half written style file on interruption
+    return str(style_path)
+
 
 # ---- Handle the legend case individually
 # Reusable function that moves the last legend entry to the axes. Redefines the axes object as parent.
@@ -56,20 +86,17 @@ def _move_legend_from_fig_to_axes(
     if fig.legends:  # if legend exist and was drawn
         last_added_legend = fig.legends[-1]
         handles = last_added_legend.legend_handles
-        labels = [t.get_text() for t in last_added_legend.get_texts()]
-        legend_kws = inspect.signature(matplotlib.legend.Legend).parameters
-        props = {
-            k: v for k, v in last_added_legend.properties().items() if k in legend_kws
-        }
+        labels = list(map(methodcaller("get_text"), last_added_legend.get_texts()))
+        title = (
+            last_added_legend.get_title().get_text()
+        )  # only the title is taken over, no need to collect all legend properties
 
-        fig.legends = fig.legends[
-            :-1
-        ]  # delete last entry of the figure, handle will update the figure automatically
+        fig.legends.pop()  # delete last entry of the figure in place, handle will update the figure automatically
 
         axes.legend(
             handles,
             labels,
-            title=props["title"].get_text(),
+            title=title,
             bbox_to_anchor=(1.0, 0.5),
         )  # add the legend to the axes
 
@@ -83,8 +110,15 @@ class Renderer(ABC):
 
     """
 
+    __slots__ = ()
+
     @abstractmethod
-    def render(self, plot: so.Plot, axes: matplotlib.axes._axes.Axes) -> None:
+    def render(
+        self,
+        plot: so.Plot,
+        axes: matplotlib.axes._axes.Axes,
+        theme: Dict[str, Any] | None = None,
+    ) -> None:
         pass
 
 
@@ -93,12 +127,37 @@ class RenderEngineSeaborn(Renderer):
     """
     The Concrete Render class for the seaborn object API.
     QT5AGG is used as backend and the plot.on method is used to get access to more customization.
+    On headless machines (no display found) the non-interactive Agg backend is used instead.
 
     """
 
-    def __init__(self) -> None:
+    __slots__ = ()
+
+    def __init__(self, interactive: bool | None = None) -> None:
+        """
+        Parameters
+        ----------
+        interactive : bool | None, optional
+            Uses the interactive Qt5Agg backend if True, otherwise Agg.
+            The default is None, which checks if a display is available.
+
+        """
         backend = matplotlib.get_backend()
-        if backend not in ["Qt5Agg"]:
+        keep_backend = False
+        if interactive is None:
+            interactive = bool(
+                os.environ.get("DISPLAY")
+                or os.environ.get("WAYLAND_DISPLAY")
+                or sys.platform in ("darwin", "win32")
+            )
+            keep_backend = backend.startswith(
+                "module://"
+            )  # notebook backends (inline, ipympl widget) render without a display
+        if not interactive:
+            if backend.lower() != "agg" and not keep_backend:
+                print(f"Used {backend} switched to Agg (no display found)")
+                matplotlib.use("Agg", force=True)
+        elif backend.lower() != "qt5agg":
             print(f"Used {backend} switched to Qt5Agg")
             try:
                 matplotlib.use("Qt5Agg")
@@ -106,7 +165,12 @@ class RenderEngineSeaborn(Renderer):
                 print(f"Keeping {backend} because Qt5Agg cannot be imported")
             plt.ion()
 
-    def render(self, plot: so.Plot, axes: matplotlib.axes._axes.Axes) -> None:
+    def render(
+        self,
+        plot: so.Plot,
+        axes: matplotlib.axes._axes.Axes,
+        theme: Dict[str, Any] | None = None,
+    ) -> None:
         """
         This method will draw a seaborn object plot onto a matplotlib axes.
         Before the seaborn object plot will be drawn, all artists that visualize data are removed.
@@ -120,28 +184,24 @@ class RenderEngineSeaborn(Renderer):
             seaborn object plot which holds the data.
         axes : matplotlib.axes._axes.Axes
             The target axes where the seaborn plot will be drawn on.
+        theme : Dict[str, Any] | None, optional
+            Snapshot of the rc parameters the plot is rendered with. The default is None, which uses the current matplotlib.rcParams.
 
         Returns
         -------
         None
 
         """
-        artists = axes.get_children()  # get all axes elements
-        for pos, art in enumerate(artists):
-            try:
-                if isinstance(
-                    art,
-                    mcoll.Collection
-                    | mlines.Line2D
-                    | mpatches.Rectangle
-                    | mlegend.Legend,
-                ):
-                    artists[
-                        pos
-                    ].remove()  # remove all artists that show data points and legend (see https://matplotlib.org/3.7.1/api/artist_api.html) with remove method to trigger the refresh event. Simple deletion does not work here!
-            except NotImplementedError:
-                artists.pop(pos)
-        plot.theme(matplotlib.rcParams).on(
+        # remove all artists that show data points and legend (see https://matplotlib.org/3.7.1/api/artist_api.html) with remove method to trigger the refresh event. Simple deletion does not work here!
+        # The typed artist lists of the axes only hold data artists, no scan over all children is needed.
+        for art in (*axes.collections, *axes.lines, *axes.patches):
+            art.remove()
+        legend = axes.get_legend()
+        if legend is not None:
+            legend.remove()
+        if theme is None:
+            theme = matplotlib.rcParams
+        plot.theme(theme).on(
             axes
         ).show()  # render always with theme method! Contextmanager under the hood will set the params for one render cycle.
 
@@ -157,6 +217,8 @@ class Builder(ABC):
 
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def add_data(self, df: pd.DataFrame) -> None:
         pass
@@ -216,16 +278,53 @@ class PlotBuilder(Builder):
 
     """
 
-    def __init__(self, renderer: Renderer = RenderEngineSeaborn()) -> None:
+    __slots__ = (
+        "auto_render",
+        "verbose",
+        "is_initialized",
+        "fig",
+        "axes",
+        "p",
+        "df",
+        "xdata",
+        "ydata",
+        "plot_renderer",
+        "_theme",
+    )
+
+    def __init__(
+        self,
+        renderer: Renderer = RenderEngineSeaborn(),
+        auto_render: bool = True,
+        verbose: bool = True,
+    ) -> None:
         """
         A fresh builder instance contains a blank plot object, which is
-        used in further assembly. The style and renderer is also set in here. A custom style is used from the URL.
+        used in further assembly. The style and renderer is also set in here. A custom style is used from the URL
+        (downloaded once and cached on disk) and applied only by the first builder of the process.
+        The figure and axes are created on first draw.
+
+        Parameters
+        ----------
+        renderer : Renderer, optional
+            Render engine of the seaborn object plot. The default is RenderEngineSeaborn().
+        auto_render : bool, optional
+            Renders the plot after every data mutating method (interactive plot building).
+            If False, the rendering is deferred until "flush" is called, which renders all changes at once. The default is True.
+        verbose : bool, optional
+            Prints a message for every render. The default is True.
 
         """
+        self.auto_render = auto_render
+        self.verbose = verbose
         self.is_initialized = False
-        matplotlib.style.use(
-            "https://raw.githubusercontent.com/Schoepfloeffel/mplstyles/main/schoepfloeffel_style_1.mplstyle"
-        )
+        global _STYLE_APPLIED
+        if not _STYLE_APPLIED:
+            matplotlib.style.use(_get_style_path())
+            _STYLE_APPLIED = True
+        self._theme = dict(
+            matplotlib.rcParams
+        )  # snapshot of the style, reused by every render instead of copying the rc parameters per render
         self._reset()
         self.plot_renderer = renderer
         self.is_initialized = True
@@ -234,7 +333,7 @@ class PlotBuilder(Builder):
     def _render_with_engine(plot_func: Callable) -> None:
         """
         Method will be used as decorator for methods in the "PlotBuilder" class and will call the render engine
-        after the method call to ensure interactive plot building
+        after the method call to ensure interactive plot building (only if "auto_render" is set, otherwise see "flush")
 
         Parameters
         ----------
@@ -246,18 +345,85 @@ class PlotBuilder(Builder):
         @wraps(plot_func)
         def wrapper(self, *args, **kwargs):
             plot_func(self, *args, **kwargs)
-            print(
-                f"Rendering seaborn object with method: {plot_func.__name__.lstrip('_').upper()}"
-            )
-            self.plot_renderer.render(self.p, self.axes)
+            if self.auto_render:
+                if self.verbose:
+                    print(
+                        f"Rendering seaborn object with method: {plot_func.__name__.lstrip('_').upper()}"
+                    )
+                self.flush()
             return None
 
         return wrapper
 
+    def flush(self) -> None:
+        """
+        Renders the seaborn object plot with the render engine.
+        With "auto_render" disabled, call this once after all building steps to compile and draw the plot a single time.
+
+        """
+
+        self._ensure_axes()
+        self.plot_renderer.render(self.p, self.axes, theme=self._theme)
+
+    def _ensure_axes(self) -> None:
+        """
+        Allocates the matplotlib figure and axes on first use. Creating the axes is the most expensive part of a fresh builder,
+        so it is deferred until something is drawn (render, cosmetic setters, ticks).
+
+        """
+
+        if self.fig is None:
+            self.fig, self.axes = plt.subplots()
+
+    def _draw_on_canvas(plot_func: Callable) -> None:
+        """
+        Method will be used as decorator for cosmetic methods (labels, title, limits) in the "PlotBuilder" class.
+        Cosmetic changes are applied directly to the matplotlib axes and do not need to recompile the seaborn object plot,
+        so only an idle redraw of the canvas is requested after the method call.
+
+        Parameters
+        ----------
+        plot_func : Callable
+            The plot builder function/method
+
+        """
+
+        @wraps(plot_func)
+        def wrapper(self, *args, **kwargs):
+            self._ensure_axes()
+            plot_func(self, *args, **kwargs)
+            self.fig.canvas.draw_idle()
+            return None
+
+        return wrapper
+
+    def _set_limit(self, axis: str, limit_tuple: Tuple[int, int]) -> None:
+        """
+        Sets the limits of an axis on the matplotlib axes the same way the seaborn object plot does
+        (string limits of nominal scales are extended by half a category).
+
+        Parameters
+        ----------
+        axis : str
+            "x" or "y"
+        limit_tuple : Tuple[int, int]
+
+        """
+
+        convert_units = getattr(self.axes, f"{axis}axis").convert_units
+        lo, hi = limit_tuple
+        lo = lo if lo is None else convert_units(lo)
+        hi = hi if hi is None else convert_units(hi)
+        if isinstance(limit_tuple[0], str):
+            lo = lo - 0.5
+        if isinstance(limit_tuple[1], str):
+            hi = hi + 0.5
+        self.axes.set(**{f"{axis}lim": (lo, hi)})
+
     def _reset(self) -> None:
         """
-        Will allocate an empty matplotlib figure, axes and an empty seaborn object plot.
-        If it was already allocated within the instance, we just clear the axes call another empty seaborn object plot.
+        Will allocate an empty seaborn object plot. The matplotlib figure and axes are allocated lazily on first draw (see "_ensure_axes").
+        If they were already allocated within the instance, we just clear the axes and call another empty seaborn object plot.
 
         NOTE:
             The method should be not used outside of the class, but the possiblity is given to the user to call it.
@@ -265,11 +431,9 @@ class PlotBuilder(Builder):
         """
 
         if not self.is_initialized:
-            (
-                self.fig,
-                self.axes,
-            ) = plt.subplots()  # allocate empty figure and empty axes at __init__
-        else:
+            self.fig = None  # figure and axes are allocated on first draw
+            self.axes = None
+        elif self.fig is not None:
             self.fig.legends = (
                 []
             )  # clear legend (legend is always a bit of a special artist in matplotlib/seaborn)
@@ -398,11 +562,11 @@ class PlotBuilder(Builder):
         if not isinstance(mark, so.Mark):
             raise TypeError(f"Expected so.Mark from seaborn object, got {type(mark)}")
         if not all(
-            isinstance(transform, so.Stat | so.Move | so.Mark)
-            for transform in transforms
+            isinstance(transform, _ALLOWED_TRANSFORMS) for transform in transforms
         ):
+            invalid = [type(transform).__name__ for transform in transforms]
             raise TypeError(
-                f"Expected so.Mark or so.Stat from seaborn object, got {list(map(lambda x: type(x), transforms))}"
+                f"Expected so.Mark or so.Stat from seaborn object, got {invalid}"
             )
         self.p = self.p.add(mark, *transforms, **kwargs)
 
@@ -422,7 +586,7 @@ class PlotBuilder(Builder):
 
         self.p = self.p.scale(**scale)
 
-    @_render_with_engine
+    @_draw_on_canvas
     def add_title(self, label_str: str) -> None:
         """
         Adds title to the seaborn object plot.
@@ -433,9 +597,10 @@ class PlotBuilder(Builder):
 
         """
 
-        self.p = self.p.label(title=label_str)
+        self.p = self.p.label(title=label_str)  # kept for later renders
+        self.axes.set_title(label_str)
 
-    @_render_with_engine
+    @_draw_on_canvas
     def set_xlabel(self, label_str: str) -> None:
         """
         Adds x label to the seaborn object plot.
@@ -446,9 +611,10 @@ class PlotBuilder(Builder):
 
         """
 
-        self.p = self.p.label(x=label_str)
+        self.p = self.p.label(x=label_str)  # kept for later renders
+        self.axes.set_xlabel(label_str)
 
-    @_render_with_engine
+    @_draw_on_canvas
     def set_ylabel(self, label_str: str) -> None:
         """
         Adds y label to the seaborn object plot.
@@ -459,9 +625,10 @@ class PlotBuilder(Builder):
 
         """
 
-        self.p = self.p.label(y=label_str)
+        self.p = self.p.label(y=label_str)  # kept for later renders
+        self.axes.set_ylabel(label_str)
 
-    @_render_with_engine
+    @_draw_on_canvas
     def set_xlim(self, limit_tuple: Tuple[int, int]) -> None:
         """
         Sets scale limits of the x-axis seaborn object plot.
@@ -472,9 +639,10 @@ class PlotBuilder(Builder):
 
         """
 
-        self.p = self.p.limit(x=limit_tuple)
+        self.p = self.p.limit(x=limit_tuple)  # kept for later renders
+        self._set_limit("x", limit_tuple)
 
-    @_render_with_engine
+    @_draw_on_canvas
     def set_ylim(self, limit_tuple: Tuple[int, int]) -> None:
         """
         Sets scale limits of the y-axis seaborn object plot.
@@ -485,7 +653,8 @@ class PlotBuilder(Builder):
 
         """
 
-        self.p = self.p.limit(y=limit_tuple)
+        self.p = self.p.limit(y=limit_tuple)  # kept for later renders
+        self._set_limit("y", limit_tuple)
 
     def set_xtick(self, ticks: List[float | str]) -> None:
         """
@@ -498,6 +667,7 @@ class PlotBuilder(Builder):
 
         """
 
+        self._ensure_axes()
         self.axes.set_xticks(ticks)
 
     def set_ytick(self, ticks: List[float | str]) -> None:
@@ -511,6 +681,7 @@ class PlotBuilder(Builder):
 
         """
 
+        self._ensure_axes()
         self.axes.set_yticks(ticks)
 
     def __del__(self) -> None:
@@ -519,4 +690,5 @@ class PlotBuilder(Builder):
 
         """
 
-        plt.close(self.fig)
+        if self.fig is not None:
+            plt.close(self.fig)
@@ -1,9 +1,112 @@
 from abc import ABC, abstractmethod
-from typing import List
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+from _constants.data_constants import BOOKIE_SET, MARKET_SET, Bookie, Market
+from _utils.patterns import alternation_pattern
+
+_OPEN_CLOSED = frozenset(["open", "closed"])
+
+
+@lru_cache(maxsize=128)
+def _odds_slicer_columns(
+    columns: Tuple[str, ...],
+    bookmaker: Tuple[str, ...],
+    odds_market: Tuple[str, ...],
+    open_closed: Tuple[str, ...],
+    active: bool,
+) -> Tuple[int, ...]:
+    """
+    Positions of the odds columns to slice. All conditions are combined into one boolean mask over the column names
+    and the result is cached on the column names and slicer arguments, repeated slicing of the same schema skips the scan.
+
+    Parameters
+    ----------
+    columns : Tuple[str, ...]
+        Column names of the dataframe
+    bookmaker : Tuple[str, ...]
+        Bookmakers to slice
+    odds_market : Tuple[str, ...]
+        Markets to slice
+    open_closed : Tuple[str, ...]
+        Closed or open odds to slice
+    active : bool
+        Keeps the active column of odds
+
+    Returns
+    -------
+    Tuple[int, ...]
+        Positions of the sliced columns
+
+    """
+
+    open_closed = sorted(
+        _OPEN_CLOSED - set(open_closed)
+    )  # get opposite of value to drop the open or closed columns and not filter by them (otherwise we lose the active column)
+
+    # one boolean mask over the column names, bookmaker and market must be contained, open/closed and active must not
+    names = pd.Index(columns, dtype=object).str
+    keep = np.ones(len(columns), dtype=bool)
+    if bookmaker:  # slice bookmaker
+        keep &= np.asarray(
+            names.contains(alternation_pattern(frozenset(bookmaker), "", "_"))
+        )
+    if odds_market:  # slice odds market
+        keep &= np.asarray(
+            names.contains(alternation_pattern(frozenset(odds_market), "_", "_"))
+        )
+    if len(open_closed) == 1:  # drop open or closed odds
+        keep &= ~np.asarray(names.contains("_" + open_closed[0], regex=False))
+    if not active:  # drop active column
+        keep &= ~np.asarray(names.contains("_active", regex=False))
+
+    return tuple(np.flatnonzero(keep).tolist())
+
+
+# column name substrings of the sofascore statistic categories
+_STATISTICS_GROUPS = {
+    "formation": ("formation",),
+    "player_data": ("home_num", "away_num", "home_player", "away_player"),
+    "incident": ("incident",),
+    "statistics": ("stats",),
+    "graph": ("minute",),
+    "vote": ("vote",),
+}
+
+
+@lru_cache(maxsize=32)
+def _statistics_column_index(columns: Tuple[str, ...]) -> Dict[str, np.ndarray]:
+    """
+    Positions of the columns of each sofascore statistic category, built in a single pass over the column names.
+    The result is cached on the column names, repeated slicing of the same schema skips the scan.
+
+    Parameters
+    ----------
+    columns : Tuple[str, ...]
+        Column names of the dataframe
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        Read-only integer positions by category (keys of _STATISTICS_GROUPS)
+
+    """
+
+    buckets = {group: [] for group in _STATISTICS_GROUPS}
+    for i, c in enumerate(columns):
+        for group, substrings in _STATISTICS_GROUPS.items():
+            if any(sub in c for sub in substrings):
+                buckets[group].append(i)
+
+    index = {}
+    for group, positions in buckets.items():
+        index[group] = np.array(positions, dtype=np.intp)
+        index[group].flags.writeable = False  # shared by all cache hits
+    return index
+
 
 # strategy interface
 class Slicer(ABC):
@@ -12,6 +115,8 @@ class Slicer(ABC):
     strategies.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def apply_slicer(self, df: pd.DataFrame, **kwargs) -> pd.DataFrame:
         """
@@ -34,6 +139,8 @@ class ContextSlicer:
     The Context defines the reference to one of the concrete slicer strategies for pd.DataFrame.
     """
 
+    __slots__ = ("_slice_strategy",)
+
     slice_strategy: Slicer
 
     def __init__(self, slice_strategy: Slicer = None) -> None:
@@ -75,6 +182,42 @@ class InfoSlicer(Slicer):
     Note: This can be helpful to do quick concenations on slices of the datasets.
     """
 
+    __slots__ = ()
+
+    _INFO_COLS: Tuple[str, ...] = (
+        "status_code",
+        "status_description",
+        "date_sofascore",
+        "date_oddsportal",
+        "country_sofascore",
+        "country_oddsportal",
+        "league_sofascore",
+        "league_oddsportal",
+        "season",
+        "round",
+        "home_team_sofascore",
+        "away_team_sofascore",
+        "home_team_short_name",
+        "away_team_short_name",
+        "home_team_oddsportal",
+        "away_team_oddsportal",
+        "goal_string",
+        "goal_ht_sofascore",
+        "goal_ft_sofascore",
+        "goal_ht_oddsportal",
+        "goal_ft_oddsportal",
+        "goal_fullandextratime_sofascore",
+        "goal_fulltime_oddsportal",
+        "goal_fullandextratime_oddsportal",
+        "result_ht_sofascore",
+        "result_ft_sofascore",
+        "result_ht_oddsportal",
+        "result_ft_oddsportal",
+        "winner_code_sofascore",
+        "result_fulltime_oddsportal",
+        "url",
+    )
+
     def apply_slicer(
         self,
         df: pd.DataFrame,
@@ -92,41 +235,7 @@ class InfoSlicer(Slicer):
 
         """
 
-        info_list = [
-            "status_code",
-            "status_description",
-            "date_sofascore",
-            "date_oddsportal",
-            "country_sofascore",
-            "country_oddsportal",
-            "league_sofascore",
-            "league_oddsportal",
-            "season",
-            "round",
-            "home_team_sofascore",
-            "away_team_sofascore",
-            "home_team_short_name",
-            "away_team_short_name",
-            "home_team_oddsportal",
-            "away_team_oddsportal",
-            "goal_string",
-            "goal_ht_sofascore",
-            "goal_ft_sofascore",
-            "goal_ht_oddsportal",
-            "goal_ft_oddsportal",
-            "goal_fullandextratime_sofascore",
-            "goal_fulltime_oddsportal",
-            "goal_fullandextratime_oddsportal",
-            "result_ht_sofascore",
-            "result_ft_sofascore",
-            "result_ht_oddsportal",
-            "result_ft_oddsportal",
-            "winner_code_sofascore",
-            "result_fulltime_oddsportal",
-            "url",
-        ]
-
-        return df[info_list]
+        return df[list(self._INFO_COLS)]
 
 
 class StatisticsSlicer(Slicer):
@@ -140,6 +249,8 @@ class StatisticsSlicer(Slicer):
         6. votes from user base
     """
 
+    __slots__ = ()
+
     def apply_slicer(
         self,
         df: pd.DataFrame,
@@ -175,24 +286,20 @@ class StatisticsSlicer(Slicer):
 
         """
 
-        sliced_dfs = []
-        if formation:
-            sliced_dfs.append(df.filter(regex="formation"))
-        if player_data:
-            sliced_dfs.append(
-                df.filter(regex="home_num|away_num|home_player|away_player")
-            )
-        if incident:
-            sliced_dfs.append(df.filter(regex="incident"))
-        if statistics:
-            sliced_dfs.append(df.filter(regex="stats"))
-        if graph:
-            sliced_dfs.append(df.filter(regex="minute"))
-        if vote:
-            sliced_dfs.append(df.filter(regex="vote"))
-
-        if sliced_dfs:
-            return pd.concat(sliced_dfs, axis=1, join="inner")
+        flags = {
+            "formation": formation,
+            "player_data": player_data,
+            "incident": incident,
+            "statistics": statistics,
+            "graph": graph,
+            "vote": vote,
+        }
+        column_index = _statistics_column_index(tuple(df.columns))
+        sliced_idxs = [column_index[group] for group, flag in flags.items() if flag]
+
+        if sliced_idxs:
+            # all categories share the row index of df, one positional slice replaces the concat
+            return df.iloc[:, np.concatenate(sliced_idxs)]
         else:
             return df
 
@@ -207,6 +314,12 @@ class OddsSlicer(Slicer):
         4. active: The active column of odds is retained
     """
 
+    __slots__ = ()
+
+    _ALLOWED_BOOKMAKERS: frozenset = BOOKIE_SET
+    _ALLOWED_MARKETS: frozenset = MARKET_SET
+    _ALLOWED_OPEN_CLOSED: frozenset = _OPEN_CLOSED
+
     def apply_slicer(
         self,
         df: pd.DataFrame,
@@ -251,109 +364,33 @@ class OddsSlicer(Slicer):
         if not isinstance(open_closed, list):
             open_closed = [open_closed]
 
-        allowed_bookmaker = [
-            "iFortuna.cz",
-            "eFortuna.pl",
-            "Tipsport.cz",
-            "STS.pl",
-            "bet-at-home",
-            "Chance.cz",
-            "bwin.es",
-            "bwin",
-            "iFortuna.sk",
-            "William Hill",
-            "BetVictor",
-            "10Bet",
-            "ComeOn",
-            "Betfair Exchange",
-            "Betsafe",
-            "Betsson",
-            "bet365",
-            "Marathonbet",
-            "888sport",
-            "Unibet",
-            "188BET",
-            "NordicBet",
-            "Vulkan Bet",
-            "Winline.ru",
-            "Tipsport.sk",
-            "bet365.it",
-            "1xStavka.ru",
-            "1xBet",
-            "Marsbet",
-            "Planetwin365",
-            "Betfair",
-            "Unibet.it",
-            "Dafabet",
-            "Betway",
-            "Coolbet",
-            "WilliamHill.it",
-            "Interwetten",
-            "Betfred",
-            "bwin.it",
-            "Pinnacle",
-            "Totolotek.pl",
-            "Curebet",
-            "VOBET",
-            "10x10bet",
-            "Lasbet",
-            "GGBET",
-            "GGBET.ru",
-            "Eurobet.it",
-            "N1 Bet",
-            "bwin.fr",
-            "Smarkets",
-            "Sportium.es",
-            "Matchbook",
-            "France Pari",
-            "Betclic.fr",
-        ]
-
-        allowed_odds_markets = [
-            "1x2",
-            "BTTS",
-            "DC",
-            "DNB",
-            "HTFT",
-            "OU",
-            "AH",
-            "CS",
-        ]
-
-        allowed_open_closed = ["open", "closed"]
-
-        # sanity check the allowed values
-        for bm in bookmaker:
-            if bm not in allowed_bookmaker:
-                raise ValueError(
-                    f"Invalid bookmaker: '{bm}'. Allowed bookmakers are {allowed_bookmaker}."
-                )
-
-        for om in odds_market:
-            if om not in allowed_odds_markets:
-                raise ValueError(
-                    f"Invalid market: '{om}'. Allowed market are {allowed_odds_markets}."
-                )
-
-        for oc in open_closed:
-            if oc not in allowed_open_closed:
-                raise ValueError(
-                    f"Invalid time: '{oc}'. Allowed times are {allowed_open_closed}."
-                )
-        open_closed = list(
-            set(allowed_open_closed) - set(open_closed)
-        )  # get opposite of value to drop the open or closed columns and not filter by them (otherwise we lose the active column)
-
-        if bookmaker:  # slice bookmaker
-            pattern1 = "|".join(list(map(lambda x: x + "_", bookmaker)))
-            df = df.filter(regex=pattern1)
-        if odds_market:  # slice odds market
-            pattern2 = "|".join(list(map(lambda x: "_" + x + "_", odds_market)))
-            df = df.filter(regex=pattern2)
-        if open_closed:  # drop open or closed odds
-            pattern3 = "|".join(list(map(lambda x: "^(?!.*_" + x + ")", open_closed)))
-            df = df.filter(regex=pattern3)
-        if not active:  # drop active column
-            pattern4 = "^(?!.*_active)"
-            df = df.filter(regex=pattern4)
-        return df
+        # sanity check the allowed values, all invalid entries are reported at once
+        invalid = set(bookmaker) - self._ALLOWED_BOOKMAKERS
+        if invalid:
+            raise ValueError(
+                f"Invalid bookmaker: {sorted(invalid, key=str)}. Allowed bookmakers are {Bookie.BOOKIE}."
+            )
+
+        invalid = set(odds_market) - self._ALLOWED_MARKETS
+        if invalid:
+            raise ValueError(
+                f"Invalid market: {sorted(invalid, key=str)}. Allowed market are {Market.MARKET}."
+            )
+
+        invalid = set(open_closed) - self._ALLOWED_OPEN_CLOSED
+        if invalid:
+            raise ValueError(
+                f"Invalid time: {sorted(invalid, key=str)}. Allowed times are {sorted(self._ALLOWED_OPEN_CLOSED)}."
+            )
+
+        if not (bookmaker or odds_market or open_closed) and active:
+            return df  # nothing to slice
+
+        cols = _odds_slicer_columns(
+            tuple(df.columns),
+            tuple(bookmaker),
+            tuple(odds_market),
+            tuple(open_closed),
+            active,
+        )
+        return df.iloc[:, list(cols)]
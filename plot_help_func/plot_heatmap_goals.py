@@ -1,98 +1,167 @@
-import matplotlib.pyplot as plt
+from typing import Any, List, Tuple
+
 import numpy as np
 import pandas as pd
 import seaborn as sns
+from matplotlib.axes import Axes
+from matplotlib.collections import PathCollection
 from matplotlib.patches import Rectangle
+from matplotlib.path import Path
+from numba import njit
+
+# constant plot settings, built once at import
+_COPPER_PALETTE = sns.light_palette("xkcd:copper", 8)  # 8 discrete heatmap colors
+_OUTCOME_COLORS = [(1, 0, 0, 0.5), (0, 0, 0, 1), (0, 0, 1, 0.5)]  # home, draw, away
 
+# constant 7x7 grid of the heatmap (0-6 goals)
+_ROWS = _COLS = 7
+_HOME_GOAL, _AWAY_GOAL = np.indices((_ROWS, _COLS))
+# outcome of each cell: 0 home win (red), 1 draw (black), 2 away win (blue)
+_OUTCOME = np.where(
+    _HOME_GOAL > _AWAY_GOAL, 0, np.where(_HOME_GOAL == _AWAY_GOAL, 1, 2)
+).ravel()
 
-def plot_heatmap_goals(df: pd.DataFrame):
+
+def _outcome_border_paths() -> List[Path]:
     """
-    Plot heatmap of goal distribution based on odds DataFrame.
+    Build the borders of the home win, away win and draw cells of the heatmap grid.
+
+    Returns:
+    List[Path]: One compound path of line segments per outcome in the order home win, away win, draw.
+
+    """
+    # unit squares of all cells as one vertex array, position (0,0) is bottom left
+    origins = np.stack([_ROWS - _HOME_GOAL - 1, _COLS - _AWAY_GOAL - 1], axis=-1)
+    squares = origins.reshape(-1, 1, 2) + np.array([[0, 0], [1, 0], [1, 1], [0, 1]])
+    # the 4 edges of every cell, endpoints sorted so both cells of a shared edge give the same segment
+    edges = np.sort(
+        np.stack([squares, np.roll(squares, -1, axis=1)], axis=2), axis=2
+    ).reshape(-1, 2, 2)
+    edge_outcome = np.repeat(_OUTCOME, 4)
+    # keep every grid segment once, a segment next to a draw cell is drawn black (home and away cells never touch)
+    order = np.argsort(edge_outcome != 1, kind="stable")
+    _, first = np.unique(edges[order].reshape(-1, 4), axis=0, return_index=True)
+    edges, edge_outcome = edges[order[first]], edge_outcome[order[first]]
+    # one compound path per outcome, each is stroked once so the transparent colors do not stack on the grid corners
+    return [
+        Path(
+            edges[edge_outcome == k].reshape(-1, 2),
+            np.tile([Path.MOVETO, Path.LINETO], np.count_nonzero(edge_outcome == k)),
+            readonly=True,  # shared by all plots
+        )
+        for k in (0, 2, 1)  # draw last, the black diagonal stays on top
+    ]
+
+
+_OUTCOME_PATHS = _outcome_border_paths()
+
+
+@njit(cache=True)
+def _tally_goals(home: np.ndarray, away: np.ndarray) -> np.ndarray:
+    """
+    Count the results in a 7x7 matrix of home and away goals, 6 holds all results with 6 or more goals
+    and 0 all negative ones (the compiled loop does not check the bounds).
+
+    Parameters:
+    home (np.ndarray): Home goals of every result.
+    away (np.ndarray): Away goals of every result.
+
+    Returns:
+    np.ndarray: Counts of the results, rows are home goals and columns are away goals.
+
+    """
+    counts = np.zeros((7, 7), dtype=np.int64)
+    for k in range(home.size):
+        counts[max(0, min(home[k], 6)), max(0, min(away[k], 6))] += 1
+    return counts
+
+
+def _split_goals(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split the "home:away" results into two integer arrays, matches without result or with a malformed result are skipped.
 
     Parameters:
     df (pd.DataFrame): The DataFrame containing the relevant data.
 
     Returns:
-    None
+    Tuple[np.ndarray, np.ndarray]: Home and away goals of every result, clipped to the 0-6 bins.
 
     """
-    goals = pd.DataFrame()
-    goals[["Home", "Away"]] = df["goal_fullandextratime_sofascore"].str.split(
-        ":", expand=True
-    )
-    goals_count = pd.crosstab(goals["Home"], goals["Away"]).iloc[
-        :7, :7
-    ]  # slice to 5 goals max
-    goals_perc = (
-        pd.crosstab(goals["Home"], goals["Away"], normalize="all").iloc[:7, :7] * 100
+    goals = np.char.partition(
+        df["goal_fullandextratime_sofascore"].dropna().to_numpy(dtype=str), ":"
     )
-    annot = (
-        goals_count.astype(str) + "\n" + "(" + goals_perc.round(2).astype(str) + "%)"
+    home = pd.to_numeric(goals[:, 0], errors="coerce")
+    away = pd.to_numeric(goals[:, 2], errors="coerce")
+    valid = ~(np.isnan(home) | np.isnan(away))  # e.g. empty strings of broken rows
+    # clip to the 0-6 bins before the cast, 6 holds all results with 6 or more goals and
+    # larger values would wrap around in int8 (goals fit into int8, smaller keys for the tally)
+    home = np.clip(home[valid], 0, 6).astype(np.int8)
+    away = np.clip(away[valid], 0, 6).astype(np.int8)
+    return home, away
+
+
+def _draw_heatmap_goals(
+    goals_count: np.ndarray, total: int, league: Any, ax: Axes | None
+):
+    """
+    Draw the heatmap of a goal count matrix with the outcome borders and the legend of the outcome ratios.
+
+    Parameters:
+    goals_count (np.ndarray): 7x7 counts of the results, rows are home goals and columns are away goals.
+    total (int): Number of all results, the base of the percentages.
+    league (Any): League shown in the title.
+    ax (Axes | None): Axes to draw on, the current axes if None.
+
+    Returns:
+    None
+
+    """
+    goals_perc = goals_count / total * 100
+    # build the "count\n(perc%)" labels on the plain arrays, no intermediate DataFrames
+    annot = np.char.add(
+        np.char.add(goals_count.astype(str), "\n("),
+        np.char.add(goals_perc.round(2).astype(str), "%)"),
     )
+    # results that never happened stay blank, no text to lay out
+    annot[goals_count == 0] = ""
     # create heatmap
     axes = sns.heatmap(
         goals_count,
+        ax=ax,
         annot=annot,
         linewidth=0.5,
         fmt="",
-        cmap=sns.light_palette("xkcd:copper", 8),
+        cmap=_COPPER_PALETTE,
         cbar=False,
         annot_kws={"ha": "center", "va": "center"},
     )
+    axes.set(xlabel="Away", ylabel="Home")
     axes.set_title(
-        f"Goal distribution - Result after 90 min (n={goals_count.sum().sum()}) - in league {df['league_sofascore'].unique()}",
+        f"Goal distribution - Result after 90 min (n={total}) - in league {league}",
         fontsize=12,
     )
     # create patches to visualize home win, draw, away win
-    colors = [(1, 0, 0, 0.5), (0, 0, 0, 1), (0, 0, 1, 0.5)]
-    rows = len(goals_perc.index)
-    cols = len(goals_perc.columns)
-    for row in range(rows):
-        for col in range(cols):
-            home_goal = row
-            away_goal = col
-            # add patches, position (0,0) is bottom left
-            if home_goal > away_goal:  # home win
-                axes.add_patch(
-                    Rectangle(
-                        (rows - row - 1, cols - col - 1),
-                        1,
-                        1,
-                        fill=False,
-                        edgecolor=colors[0],  # red
-                        lw=3,
-                    )
-                )
-            elif home_goal == away_goal:  # draw
-                axes.add_patch(
-                    Rectangle(
-                        (rows - row - 1, cols - col - 1),
-                        1,
-                        1,
-                        fill=False,
-                        edgecolor=colors[1],  # black
-                        lw=3,
-                    )
-                )
-            else:  # away win
-                axes.add_patch(
-                    Rectangle(
-                        (rows - row - 1, cols - col - 1),
-                        1,
-                        1,
-                        fill=False,
-                        edgecolor=colors[2],  # blue
-                        lw=3,
-                    )
-                )
+    colors = _OUTCOME_COLORS
+    axes.add_collection(
+        PathCollection(
+            _OUTCOME_PATHS,
+            facecolors="none",
+            edgecolors=[colors[0], colors[2], colors[1]],
+            linewidths=3,
+            capstyle="projecting",  # closed corners
+        )
+    )
     axes.invert_yaxis()
     # calculate the sum of the 3 outcomes for the legend entry from the crosstab (we can also do it from the filtered df with a condition)
-    home_perc_sum = np.sum(
-        goals_perc.values[np.tril_indices(goals_perc.shape[0], k=-1)]
+    # one weighted count over the outcome of each cell instead of three passes over the triangles and the diagonal
+    home_perc_sum, draw_perc_sum, away_perc_sum = np.bincount(
+        _OUTCOME, weights=goals_perc.ravel(), minlength=3
     )
-    draw_perc_sum = np.trace(goals_perc.values)
-    away_perc_sum = np.sum(goals_perc.values[np.triu_indices(goals_perc.shape[0], k=1)])
-    leg = plt.legend(
+    axes.legend(
+        handles=[
+            Rectangle((0, 0), 1, 1, fill=False, edgecolor=color, lw=3)
+            for color in colors
+        ],  # the collection has no handle per outcome, use an outlined proxy of each outcome
         title="Ratio of match outcomes",
         title_fontsize=8,
         fontsize=7,
@@ -106,5 +175,53 @@ def plot_heatmap_goals(df: pd.DataFrame):
         bbox_to_anchor=(0, 0.92),
         frameon=False,
     )
-    for ii, entries in enumerate(leg.legend_handles):
-        entries.set_color(colors[ii])
+
+
+def plot_heatmap_goals(
+    df: pd.DataFrame, league: str | None = None, ax: Axes | None = None
+):
+    """
+    Plot heatmap of goal distribution based on odds DataFrame.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame containing the relevant data.
+    league (str | None): League shown in the title. Defaults to None, which lists the leagues found in the DataFrame.
+    ax (Axes | None): Axes to draw on, e.g. one reused Axes (cleared with ax.clear()) for many plots in a loop. Defaults to None, which uses the current axes.
+
+    Returns:
+    None
+
+    """
+    if league is None:
+        league = df["league_sofascore"].unique()
+    home, away = _split_goals(df)
+    # fixed 0-6 goal bins, the goals are already clipped by _split_goals
+    bins = np.arange(7, dtype=np.int8)
+    home = pd.Categorical(home, categories=bins)
+    away = pd.Categorical(away, categories=bins)
+    goals_count = pd.crosstab(
+        home, away, dropna=False
+    )  # always 7x7, unobserved results are kept as zero
+    _draw_heatmap_goals(goals_count.to_numpy(), len(home), league, ax)
+
+
+def plot_heatmap_goals_fast(
+    df: pd.DataFrame, league: str | None = None, ax: Axes | None = None
+):
+    """
+    Plot heatmap of goal distribution based on odds DataFrame, same plot as "plot_heatmap_goals".
+    The results are counted in a compiled loop instead of a crosstab, which is faster for repeated calls (e.g. one plot per league).
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame containing the relevant data.
+    league (str | None): League shown in the title. Defaults to None, which lists the leagues found in the DataFrame.
+    ax (Axes | None): Axes to draw on, e.g. one reused Axes (cleared with ax.clear()) for many plots in a loop. Defaults to None, which uses the current axes.
+
+    Returns:
+    None
+
+    """
+    if league is None:
+        league = df["league_sofascore"].unique()
+    home, away = _split_goals(df)
+    _draw_heatmap_goals(_tally_goals(home, away), home.size, league, ax)